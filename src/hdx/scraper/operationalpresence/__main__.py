@@ -65,6 +65,7 @@ def main(
     """
     logger.info(f"##### {lookup} version {__version__} ####")
     configuration = Configuration.read()
+    static_yaml = script_dir_plus_file(join("config", "hdx_dataset_static.yaml"), main)
     User.check_current_user_write_access("hdx", configuration=configuration)
     with HDXErrorHandler(write_to_hdx=err_to_hdx) as error_handler:
         with temp_dir() as temp_folder:
@@ -100,22 +101,14 @@ def main(
             pipeline.process()
             dataset = pipeline.generate_org_dataset(temp_folder)
             if dataset and not dont_update_hdx:
-                dataset.update_from_yaml(
-                    script_dir_plus_file(
-                        join("config", "hdx_dataset_static.yaml"), main
-                    )
-                )
+                dataset.update_from_yaml(static_yaml)
                 dataset.create_in_hdx(
                     remove_additional_resources=True,
                     updated_by_script=updated_by_script,
                 )
             dataset = pipeline.generate_3w_dataset(temp_folder)
             if dataset and not dont_update_hdx:
-                dataset.update_from_yaml(
-                    script_dir_plus_file(
-                        join("config", "hdx_dataset_static.yaml"), main
-                    )
-                )
+                dataset.update_from_yaml(static_yaml)
                 dataset.create_in_hdx(
                     remove_additional_resources=True,
                     updated_by_script=updated_by_script,
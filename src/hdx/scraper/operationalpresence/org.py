@@ -3,6 +3,7 @@
 import logging
 from dataclasses import dataclass
 from os.path import join
+from sys import intern
 from typing import NamedTuple
 
 from hdx.api.utilities.hdx_error_handler import HDXErrorHandler
@@ -14,16 +15,19 @@ from hdx.utilities.text import normalise
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrgInfo:
     canonical_name: str
     normalised_name: str
     acronym: str  # can be ""
     normalised_acronym: str  # can be ""
     type_code: str  # can be ""
-    complete: bool = False
     used: bool = False
 
+    @property
+    def complete(self) -> bool:
+        return bool(self.acronym and self.type_code)
+
 
 class OrgData(NamedTuple):
     acronym: str
@@ -47,6 +51,7 @@ class Org:
     ):
         self._datasetinfo = datasetinfo
         self._org_type = OrgType()
+        self._org_type_codes = {}
         self._error_handler = error_handler
         self.data = {}
         self._org_map = {}
@@ -69,6 +74,9 @@ class Org:
                 continue
             normalised_name = normalise(canonical_name)
             country_code = row["Location code"]
+            if country_code:
+                # Country codes repeat across most rows and make up every key
+                country_code = intern(country_code)
             acronym = row["Acronym"]
             if acronym:
                 normalised_acronym = normalise(acronym)
@@ -76,43 +84,43 @@ class Org:
                 normalised_acronym = None
             org_name = row["String pattern"]
             type_code = row["Org type code"]
-            if acronym and type_code:
-                complete = True
-            else:
-                complete = False
             org_info = OrgInfo(
                 canonical_name=canonical_name,
                 normalised_name=normalised_name,
                 acronym=acronym,
                 normalised_acronym=normalised_acronym,
                 type_code=type_code,
-                complete=complete,
             )
-            self._org_map[(country_code, canonical_name)] = org_info
-            self._org_map[(country_code, normalised_name)] = org_info
-            self._org_map[(country_code, acronym)] = org_info
-            self._org_map[(country_code, normalised_acronym)] = org_info
-            self._org_map[(country_code, org_name)] = org_info
-            self._org_map[(country_code, normalise(org_name))] = org_info
+            normalised_org_name = normalise(org_name)
+            for lookup in (
+                canonical_name,
+                normalised_name,
+                acronym,
+                normalised_acronym,
+                org_name,
+                normalised_org_name,
+            ):
+                # Empty lookups would give false matches in get_org_info
+                if lookup:
+                    self._org_map[(country_code, lookup)] = org_info
 
     def get_org_info(self, org_str: str, location: str) -> OrgInfo:
+        org_map = self._org_map
         key = (location, org_str)
-        org_info = self._org_map.get(key)
+        org_info = org_map.get(key)
         if org_info:
             return org_info
         normalised_str = normalise(org_str)
-        org_info = self._org_map.get((location, normalised_str))
-        if org_info:
-            self._org_map[key] = org_info
-            return org_info
-        org_info = self._org_map.get((None, org_str))
-        if org_info:
-            self._org_map[key] = org_info
-            return org_info
-        org_info = self._org_map.get((None, normalised_str))
-        if org_info:
-            self._org_map[key] = org_info
-            return org_info
+        # Try the normalised string, then global (no location) entries
+        for fallback_key in (
+            (location, normalised_str),
+            (None, org_str),
+            (None, normalised_str),
+        ):
+            org_info = org_map.get(fallback_key)
+            if org_info:
+                org_map[key] = org_info
+                return org_info
         org_info = OrgInfo(
             canonical_name=org_str,
             normalised_name=normalised_str,
@@ -120,7 +128,7 @@ class Org:
             normalised_acronym="",
             type_code="",
         )
-        self._org_map[key] = org_info
+        org_map[key] = org_info
         return org_info
 
     @classmethod
@@ -147,8 +155,6 @@ class Org:
                 org_info.acronym, org_info.canonical_name, org_info.type_code
             )
             self.data[key] = org_data
-        if org_info.acronym and org_info.type_code:
-            org_info.complete = True
         org_info.used = True
         return org_data
 
@@ -169,7 +175,13 @@ class Org:
 
         # * Org type processing
         if not org_info.type_code and org_type_name:
-            org_type_code = self._org_type.get_code(org_type_name)
+            # Org type names repeat across rows so cache the result, including
+            # when there is no match
+            if org_type_name in self._org_type_codes:
+                org_type_code = self._org_type_codes[org_type_name]
+            else:
+                org_type_code = self._org_type.get_code(org_type_name)
+                self._org_type_codes[org_type_name] = org_type_code
             if org_type_code:
                 org_info.type_code = org_type_code
             else:
@@ -193,22 +205,20 @@ class Org:
             "Complete",
             "Used",
         ]
-        rows = []
-        for key, org_info in self._org_map.items():
-            country_code, lookup = key
-            rows.append(
-                (
-                    country_code,
-                    lookup,
-                    org_info.canonical_name,
-                    org_info.normalised_name,
-                    org_info.acronym,
-                    org_info.normalised_acronym,
-                    org_info.type_code,
-                    "Y" if org_info.complete else "N",
-                    "Y" if org_info.used else "N",
-                )
+        rows = (
+            (
+                country_code,
+                lookup,
+                org_info.canonical_name,
+                org_info.normalised_name,
+                org_info.acronym,
+                org_info.normalised_acronym,
+                org_info.type_code,
+                "Y" if org_info.complete else "N",
+                "Y" if org_info.used else "N",
             )
+            for (country_code, lookup), org_info in self._org_map.items()
+        )
         path = join(folder, "org_map.csv")
         save_iterable(path, rows, headers=headers)
         return path
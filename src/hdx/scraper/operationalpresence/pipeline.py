@@ -1,3 +1,4 @@
+import re
 import traceback
 from datetime import datetime
 from logging import getLogger
@@ -19,10 +20,9 @@ from hdx.utilities.dateparse import (
     default_date,
     default_enddate,
     iso_string_from_datetime,
-    parse_date,
 )
 
-from .date_processing import get_dates_from_filename
+from .date_processing import get_dates_from_filename, parse_date_fast
 from .org import Org
 from .row import Row
 from .sheet import Sheet
@@ -41,6 +41,14 @@ class Pipeline:
         self._configuration = configuration
         self._sheet = sheet
         self._error_handler = error_handler
+        self._allowed_formats = frozenset(configuration["allowed_formats"])
+        self._dataseries_ignore = frozenset(configuration["dataseries_ignore"])
+        self._tags_ignore = frozenset(configuration["tags_ignore"])
+        words_ignore = configuration["words_ignore"]
+        if words_ignore:
+            self._words_ignore = re.compile("|".join(map(re.escape, words_ignore)))
+        else:
+            self._words_ignore = None
         if countryiso3s_to_process:
             self._countryiso3s_to_process = countryiso3s_to_process.split(",")
         else:
@@ -64,6 +72,8 @@ class Pipeline:
             error_handler=error_handler,
         )
         self._sector = Sector()
+        self._sector_codes = {}
+        self._adm_info_cache = {}
         self._datasets_by_iso3 = {}
         self._iso3_to_datasetinfo = {}
         self._start_date = default_enddate
@@ -72,11 +82,11 @@ class Pipeline:
         self._rows = []
 
     def get_format_from_url(self, resource: Resource) -> str | None:
-        format = resource["url"][-4:].lower()
-        if format not in self._configuration["allowed_formats"]:
-            format = resource["url"][-3:].lower()
-        if format in self._configuration["allowed_formats"]:
-            return format
+        url = resource["url"]
+        for length in (4, 3):
+            format = url[-length:].lower()
+            if format in self._allowed_formats:
+                return format
         return None
 
     def get_format(self, dataset_name: str, resource: Resource) -> tuple[bool, str]:
@@ -96,7 +106,7 @@ class Pipeline:
                 )
         else:
             format = hdx_format
-        if format in self._configuration["allowed_formats"]:
+        if format in self._allowed_formats:
             return True, format
         return False, format
 
@@ -118,56 +128,66 @@ class Pipeline:
                 continue
             if dataset.get("archived", False):
                 continue
-            if (
-                dataset.get("dataseries_name")
-                in self._configuration["dataseries_ignore"]
-            ):
+            if dataset.get("dataseries_name") in self._dataseries_ignore:
                 continue
-            if any(x in self._configuration["tags_ignore"] for x in dataset.get_tags()):
+            if not self._tags_ignore.isdisjoint(dataset.get_tags()):
                 continue
-            if any(
-                x in dataset["name"].lower()
-                for x in self._configuration["words_ignore"]
+            if self._words_ignore and self._words_ignore.search(
+                dataset["name"].lower()
             ):
                 continue
-            allowed_format = False
+            # Pick the latest modified resource with an allowed format
+            resource_to_process = None
+            latest_last_modified = default_date
             for resource in dataset.get_resources():
-                if resource.get_format() in self._configuration["allowed_formats"]:
-                    allowed_format = True
-                    break
-            if not allowed_format:
+                if resource.get_format() not in self._allowed_formats:
+                    continue
+                last_modified = parse_date_fast(resource["last_modified"])
+                if last_modified > latest_last_modified:
+                    latest_last_modified = last_modified
+                    resource_to_process = resource
+            if resource_to_process is None:
                 continue
-            existing_dataset = self._datasets_by_iso3.get(countryiso3)
-            if existing_dataset:
-                existing_enddate = existing_dataset.get_time_period()["enddate"]
+            existing = self._datasets_by_iso3.get(countryiso3)
+            if existing:
+                # The end date is only parsed once there is a dataset to compare
+                # with and is then kept alongside the dataset
+                existing_dataset, existing_resource, existing_enddate = existing
+                if existing_enddate is None:
+                    existing_enddate = existing_dataset.get_time_period()["enddate"]
                 enddate = dataset.get_time_period()["enddate"]
                 if enddate > existing_enddate:
-                    self._datasets_by_iso3[countryiso3] = dataset
+                    self._datasets_by_iso3[countryiso3] = (
+                        dataset,
+                        resource_to_process,
+                        enddate,
+                    )
+                else:
+                    self._datasets_by_iso3[countryiso3] = (
+                        existing_dataset,
+                        existing_resource,
+                        existing_enddate,
+                    )
             else:
-                self._datasets_by_iso3[countryiso3] = dataset
+                self._datasets_by_iso3[countryiso3] = (
+                    dataset,
+                    resource_to_process,
+                    None,
+                )
 
         for countryiso3 in sorted(self._datasets_by_iso3):
-            dataset = self._datasets_by_iso3[countryiso3]
-            resource_to_process = None
+            dataset, resource_to_process, _ = self._datasets_by_iso3[countryiso3]
             country_info = self._sheet.get_country_row(countryiso3)
+            manual_resource = None
             if country_info:
                 manual_resource_name = country_info["Resource"]
-            else:
-                manual_resource_name = None
-            manual_resource = None
-            latest_last_modified = default_date
-            for resource in dataset.get_resources():
-                if resource.get_format() not in self._configuration["allowed_formats"]:
-                    continue
-                if (
-                    manual_resource_name is not None
-                    and resource["name"] == manual_resource_name
-                ):
-                    manual_resource = resource
-                last_modified = parse_date(resource["last_modified"])
-                if last_modified > latest_last_modified:
-                    latest_last_modified = last_modified
-                    resource_to_process = resource
+                if manual_resource_name:
+                    for resource in dataset.get_resources():
+                        if (
+                            resource["name"] == manual_resource_name
+                            and resource.get_format() in self._allowed_formats
+                        ):
+                            manual_resource = resource
             automated_dataset_name = dataset["name"]
             automated_resource_name = resource_to_process["name"]
             automated_resource_format = resource_to_process.get_format()
@@ -217,6 +237,9 @@ class Pipeline:
         datasetinfo["format"] = format
         headers, iterator = self._reader.read_tabular(datasetinfo)
         filter = datasetinfo["Filter"]
+        if filter:
+            # Compile once rather than on every row
+            filter = compile(filter, "<filter>", "eval")
 
         if startdate_col:
             earliest_start_date = default_enddate
@@ -245,7 +268,7 @@ class Pipeline:
                 start_date_val = row[startdate_col]
                 if start_date_val:
                     try:
-                        start_date = parse_date(start_date_val)
+                        start_date = parse_date_fast(start_date_val)
                         if start_date.year < 2000:
                             raise ParserError()
                         if start_date < earliest_start_date:
@@ -258,7 +281,7 @@ class Pipeline:
                 end_date_val = row[enddate_col]
                 if end_date_val:
                     try:
-                        end_date = parse_date(end_date_val)
+                        end_date = parse_date_fast(end_date_val)
                         if end_date > latest_end_date:
                             latest_end_date = end_date
                     except ParserError:
@@ -292,7 +315,12 @@ class Pipeline:
             sector_orig = row[sector_col]
             # Skip rows that are missing a sector
             if sector_orig:
-                sector_code = self._sector.get_code(sector_orig)
+                # Sector values repeat heavily so cache them, including misses
+                if sector_orig in self._sector_codes:
+                    sector_code = self._sector_codes[sector_orig]
+                else:
+                    sector_code = self._sector.get_code(sector_orig)
+                    self._sector_codes[sector_orig] = sector_code
                 if sector_code:
                     row[sector_col] = sector_code
                 else:
@@ -318,7 +346,11 @@ class Pipeline:
 
             # * Org processing
             org_info = self._org.get_org_info(org_str, location=countryiso3)
-            if not org_info.complete:
+            if org_info.complete:
+                # Matching a complete org again would change nothing
+                if org_info.used:
+                    continue
+            else:
                 if org_type_col:
                     org_type_name = row[org_type_col]
                 else:
@@ -365,19 +397,37 @@ class Pipeline:
             adm_codes = [row[x] if x else "" for x in adm_code_cols]
         else:
             adm_codes = ["" for _ in provider_adm_names]
-        adm_names = ["" for _ in provider_adm_names]
-        adm_level, warnings = complete_admins(
-            self._admins, countryiso3, provider_adm_names, adm_codes, adm_names
-        )
-        for warning in warnings:
-            self._error_handler.add_message(
-                "OperationalPresence",
-                dataset_name,
-                warning,
-                message_type="warning",
+        # Nothing to match so this is national level data
+        if not any(provider_adm_names) and not any(adm_codes):
+            no_adms = ["" for _ in provider_adm_names]
+            return no_adms, list(no_adms), list(no_adms), 0
+        # The same admin names and codes recur across many rows
+        key = (countryiso3, tuple(provider_adm_names), tuple(adm_codes))
+        adm_info = self._adm_info_cache.get(key)
+        if adm_info is None:
+            adm_names = ["" for _ in provider_adm_names]
+            adm_level, warnings = complete_admins(
+                self._admins, countryiso3, provider_adm_names, adm_codes, adm_names
+            )
+            for warning in warnings:
+                self._error_handler.add_message(
+                    "OperationalPresence",
+                    dataset_name,
+                    warning,
+                    message_type="warning",
+                )
+            adm_info = (
+                tuple(provider_adm_names),
+                tuple(adm_codes),
+                tuple(adm_names),
+                adm_level,
+                warnings,
             )
-            row["Warning"].append(warning)
-        return provider_adm_names, adm_codes, adm_names, adm_level
+            self._adm_info_cache[key] = adm_info
+        provider_adm_names, adm_codes, adm_names, adm_level, warnings = adm_info
+        row["Warning"].extend(warnings)
+        # Return new lists as the caller pads them in place
+        return list(provider_adm_names), list(adm_codes), list(adm_names), adm_level
 
     def process_country(
         self, countryiso3: str, datasetinfo: dict
@@ -385,9 +435,7 @@ class Pipeline:
         logger.info(f"Processing {countryiso3}...")
         dataset_name = datasetinfo["dataset"]
         adm_code_cols = datasetinfo["Adm Code Columns"]
-        if adm_code_cols:
-            adm_code_cols = adm_code_cols.split(",")
-        adm_name_cols = datasetinfo["Adm Name Columns"].split(",")
+        adm_name_cols = datasetinfo["Adm Name Columns"]
         org_name_col = datasetinfo["Org Name Column"]
         org_acronym_col = datasetinfo["Org Acronym Column"]
         sector_col = datasetinfo["Sector Column"]
@@ -395,6 +443,10 @@ class Pipeline:
         end_date = datasetinfo["time_period"]["end"]
         start_date_str = iso_string_from_datetime(start_date)
         end_date_str = iso_string_from_datetime(end_date)
+        dataset_id = datasetinfo["hapi_dataset_metadata"]["hdx_id"]
+        resource_id = datasetinfo["hapi_resource_metadata"]["hdx_id"]
+        has_hrp = "Y" if Country.get_hrp_status_from_iso3(countryiso3) else "N"
+        in_gho = "Y" if Country.get_gho_status_from_iso3(countryiso3) else "N"
         output_rows = {}
         rows = datasetinfo["rows"]
         for row in rows:
@@ -418,9 +470,6 @@ class Pipeline:
                 dataset_name,
             )
 
-            dataset_id = datasetinfo["hapi_dataset_metadata"]["hdx_id"]
-            resource_id = datasetinfo["hapi_resource_metadata"]["hdx_id"]
-
             if adm_level > 2:
                 adm_level = 2
             else:
@@ -439,8 +488,8 @@ class Pipeline:
             )
             output_row = Row(
                 countryiso3,
-                "Y" if Country.get_hrp_status_from_iso3(countryiso3) else "N",
-                "Y" if Country.get_gho_status_from_iso3(countryiso3) else "N",
+                has_hrp,
+                in_gho,
                 provider_adm_names[0],
                 provider_adm_names[1],
                 adm_codes[0],
@@ -497,15 +546,17 @@ class Pipeline:
 
         self._sheet.write(list(self._datasets_by_iso3.keys()))
         self._sheet.send_email()
+        results = []
         for countryiso3, datasetinfo in self._iso3_to_datasetinfo.items():
             start_date, end_date = self.process_country(countryiso3, datasetinfo)
-            if start_date < self._start_date:
-                self._start_date = start_date
-            if end_date > self._end_date:
-                self._end_date = end_date
             hapi_dataset_metadata = datasetinfo["hapi_dataset_metadata"]
             hdx_provider_name = hapi_dataset_metadata["hdx_provider_name"]
-            self._hdx_providers.add(hdx_provider_name)
+            results.append((start_date, end_date, hdx_provider_name))
+        if results:
+            start_dates, end_dates, hdx_provider_names = zip(*results)
+            self._start_date = min(self._start_date, *start_dates)
+            self._end_date = max(self._end_date, *end_dates)
+            self._hdx_providers.update(hdx_provider_names)
 
     def generate_dataset(self, key: str) -> tuple[Dataset, dict]:
         dataset_config = self._configuration[key]
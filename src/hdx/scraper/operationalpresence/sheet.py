@@ -278,4 +278,8 @@ class Sheet:
             return {}
         if not datasetinfo["Org Acronym Column"]:
             datasetinfo["Org Acronym Column"] = datasetinfo["Org Name Column"]
+        adm_code_cols = datasetinfo["Adm Code Columns"]
+        if adm_code_cols:
+            datasetinfo["Adm Code Columns"] = adm_code_cols.split(",")
+        datasetinfo["Adm Name Columns"] = datasetinfo["Adm Name Columns"].split(",")
         return datasetinfo
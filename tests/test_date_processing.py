@@ -1,6 +1,11 @@
 import pytest
+from dateutil.parser import ParserError
+from hdx.utilities.dateparse import parse_date
 
-from hdx.scraper.operationalpresence.date_processing import get_dates_from_filename
+from hdx.scraper.operationalpresence.date_processing import (
+    get_dates_from_filename,
+    parse_date_fast,
+)
 
 
 class MockResource(dict):
@@ -83,3 +88,27 @@ def test_no_recognizable_dates():
     assert not error
     assert start == ""
     assert end == ""
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "2025-05-01",
+        "2025-05-01 00:00:00",
+        "2025-05-01T10:20:30.123",
+        "2025-05-01T10:00:00+03:00",
+        "2025-13-01",
+        # Non-ISO formats fall back to parse_date
+        "01/05/2025",
+        "May 1 2025",
+        "20250501",
+    ],
+)
+def test_parse_date_fast(date_str):
+    assert parse_date_fast(date_str) == parse_date(date_str)
+
+
+def test_parse_date_fast_week_date():
+    # ISO week dates are accepted by fromisoformat but not by parse_date
+    with pytest.raises(ParserError):
+        parse_date_fast("2025-W01-1")